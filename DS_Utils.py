@@ -19,13 +19,55 @@ CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFT
 DEALINGS IN THE SOFTWARE.
 """
 
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 from urllib.parse import urljoin
-from tqdm.auto import tqdm
+from requests.adapters import HTTPAdapter
+from tqdm.auto import tqdm  # type: ignore[import-untyped]
 import requests
+import urllib3
 import urllib
+import threading
+import queue
+import random
+import time
 import os
 
+try:
+    import ijson  # type: ignore[import-untyped]
+except ImportError:
+    ijson = None  # type: ignore
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+# HTTP status codes that indicate a transient problem worth retrying
+_RETRY_STATUS = (429, 500, 502, 503, 504)
+
+# (connect, read) timeouts in seconds for every request, so a stalled connection fails and is retried
+_REQUEST_TIMEOUT = (10, 60)
+
+# Formats of the search time range and bounding box expected by the API
+_SEARCH_TIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%fZ'
+_SEARCH_BBOX_FORMAT = '{},{},{},{}'
+
+# Token lifetime in seconds assumed if the API does not report one
+_DEFAULT_TOKEN_LIFETIME = 1200
+
+# A single session is shared by all calls so that the underlying connection pool
+# (and the TLS handshake) is reused for every search page and product download.
+_SESSION = requests.Session()
+# Retries are handled by _with_retry, so the adapter itself does not retry.
+_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=64)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
 
 def setup_debug():
     """A helper to enable debugging of the search / download procedure."""
@@ -38,7 +80,58 @@ def setup_debug():
     requests_log.propagate = True
 
 
-def default_services(api_endpoint: str = "http://api.eumetsat.int/") -> (str, str):
+def _with_retry(func: Callable[..., Any], *args: Any, max_tries: int = 6, **kwargs: Any) -> Any:
+    """Call `func(*args, **kwargs)`, retrying with exponential backoff on transient failures.
+
+    This is the only retry layer for requests to the API. It covers failed connections, transfers
+    that drop part way through and 429/5xx responses, honouring `Retry-After` when the server sends it.
+
+    Parameters:
+        func, callable:
+            The function performing the request.
+        max_tries, int:
+            Maximum number of attempts before the last error is re-raised. Default is 6.
+
+    """
+    for attempt in range(max_tries):
+        retry_after = None
+        try:
+            return func(*args, **kwargs)
+        except requests.exceptions.HTTPError as err:
+            if err.response.status_code not in _RETRY_STATUS or attempt == max_tries - 1:
+                raise
+            retry_after = err.response.headers.get('Retry-After')
+        except (requests.exceptions.ConnectionError,
+                requests.exceptions.ChunkedEncodingError,
+                requests.exceptions.Timeout,
+                urllib3.exceptions.HTTPError):
+            if attempt == max_tries - 1:
+                raise
+        delay = min(60, 0.5 * 2 ** attempt) + random.random() * 0.2
+        if retry_after is not None:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                pass
+        time.sleep(delay)
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """Decode the JSON body of a response, using `orjson` if it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _max_in_flight(response: requests.Response, n_workers: int) -> int:
+    """Limit the number of concurrent requests to the `X-RateLimit-Limit` advertised by the server, if any."""
+    try:
+        return max(1, min(n_workers, int(response.headers['X-RateLimit-Limit'])))
+    except (KeyError, ValueError):
+        return n_workers
+
+
+def default_services(api_endpoint: str = "https://api.eumetsat.int/") -> Tuple[str, str]:
     """Return the default service URLs for EUMETSAT.
 
     Parameters:
@@ -60,15 +153,15 @@ def default_services(api_endpoint: str = "http://api.eumetsat.int/") -> (str, st
     return service_search, service_download
 
 
-def get_pages(resp_json: requests.Response()):
+def get_pages(resp_json: Dict[str, Any]) -> Iterator[int]:
     """Create iterator for looping over pages in results.
 
     The EUMETSAT results are spread across a number of pages with typically 10 results per page.
     To capture all results we have to iterate over the pages, which is set up here.
 
     Parameters:
-        resp_json, requests.Response:
-           A response from the server containing results.
+        resp_json, dict:
+           A decoded response from the server containing results.
 
     """
 
@@ -81,12 +174,92 @@ def get_pages(resp_json: requests.Response()):
         cur_item += items_page
 
 
+def _parse_identifiers(resp_json: Dict[str, Any]) -> List[str]:
+    """Extract the product identifiers from one page of search results."""
+    return [selected_data_set['properties']['identifier'] for selected_data_set in resp_json['features']]
+
+
+def _checked_request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    """Send a request with the shared session, raising an error for an unsuccessful response.
+
+    The response is closed before the error is raised, so that a streamed response does not keep
+    its connection out of the pool.
+    """
+    kwargs.setdefault('timeout', _REQUEST_TIMEOUT)
+    response = _SESSION.request(method, url, **kwargs)
+    try:
+        response.raise_for_status()
+    except requests.exceptions.HTTPError:
+        response.close()
+        raise
+    return response
+
+
+def _search_request(query_url: str, stream: bool = False) -> requests.Response:
+    """Send a single search request to the API, raising an error for an unsuccessful response."""
+    return _checked_request('GET', query_url, stream=stream)
+
+
+def _fetch_page(query_url: str, si_val: int) -> List[str]:
+    """Retrieve the product identifiers on the page of search results starting at item `si_val`.
+
+    If `ijson` is installed the response is parsed as it is received and only the identifiers are kept,
+    otherwise the whole page is decoded first, using `orjson` if it is installed.
+    This runs on the search worker threads, so decoding one page does not hold up requests for the others.
+    """
+    if ijson is None:
+        response = _search_request(f'{query_url}&si={si_val}')
+        return _parse_identifiers(_decode_json(response))
+
+    with _search_request(f'{query_url}&si={si_val}', stream=True) as response:
+        response.raw.decode_content = True
+        return list(ijson.items(response.raw, 'features.item.properties.identifier'))
+
+
+def _build_query_url(start_date: datetime,
+                     end_date: datetime,
+                     search_url: str,
+                     collection_id: str,
+                     bbox: Optional[Sequence[Sequence[float]]] = None) -> str:
+    """Build the search query URL, without the page start index, for the given search parameters."""
+    dataset_parameters = {'format': 'json', 'pi': collection_id,
+                          'dtstart': start_date.strftime(_SEARCH_TIME_FORMAT),
+                          'dtend': end_date.strftime(_SEARCH_TIME_FORMAT)}
+    if bbox is not None:
+        dataset_parameters['bbox'] = _SEARCH_BBOX_FORMAT.format(bbox[0][0], bbox[0][1], bbox[1][0], bbox[1][1])
+    # The query is identical for every page apart from the start index, so only encode it once
+    return f'{search_url}?{urllib.parse.urlencode(dataset_parameters)}'
+
+
+def _probe_search(query_url: str, n_workers: int) -> Tuple[Dict[str, Any], int]:
+    """Send the initial search request, used to find the number of results.
+
+    Returns the decoded response, which also holds the first page of results, and the number of
+    pages that may be requested concurrently given any rate limit advertised by the server.
+    """
+    response = _with_retry(_search_request, query_url)
+    return _decode_json(response), _max_in_flight(response, n_workers)
+
+
+def _iter_pages(query_url: str, tmp_response: Dict[str, Any], n_workers: int) -> Iterator[List[str]]:
+    """Generate the product identifiers on each page of search results, in page order.
+
+    The first page is taken from the initial search response, the remaining pages are independent
+    of each other so are fetched concurrently.
+    """
+    yield _parse_identifiers(tmp_response)
+    si_values = list(get_pages(tmp_response))[1:]
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        yield from executor.map(lambda si_val: _with_retry(_fetch_page, query_url, si_val), si_values)
+
+
 def find_files_on_store(start_date: datetime,
                         end_date: datetime,
                         search_url: str,
                         collection_id: str = "EO:EUM:DAT:MSG:HRSEVIRI",
-                        bbox: tuple = None,
-                        verbose: bool = False) -> list:
+                        bbox: Optional[Sequence[Sequence[float]]] = None,
+                        verbose: bool = False,
+                        n_workers: int = 16) -> List[str]:
     """Retrieve details of files on the data store matching query.
 
     Parameters:
@@ -102,6 +275,8 @@ def find_files_on_store(start_date: datetime,
            Default is full globe search.
         verbose, bool:
             Switch setting whether results are printed to screen.
+        n_workers, int:
+            Number of result pages to request concurrently. Default is 16.
 
     Returns:
         list:
@@ -109,27 +284,15 @@ def find_files_on_store(start_date: datetime,
 
         """
 
-    # Format our parameters for searching
-    dataset_parameters = {'format': 'json', 'pi': collection_id,
-                          'dtstart': start_date.strftime('%Y-%m-%dT%H:%M:%S.%fZ'),
-                          'dtend': end_date.strftime('%Y-%m-%dT%H:%M:%S.%fZ')}
-    if bbox is not None:
-        dataset_parameters['bbox'] = '{},{},{},{}'.format(bbox[0][0], bbox[0][1], bbox[1][0], bbox[1][1])
-
-    dataset_list = []
-    # Initial request to find size
-    tmp_response = requests.get(search_url, dataset_parameters).json()
+    query_url = _build_query_url(start_date, end_date, search_url, collection_id, bbox)
+    tmp_response, n_workers = _probe_search(query_url, n_workers)
     n_items = tmp_response['properties']['totalResults']
-    progress_bar = tqdm()
-
-    # Now we have to loop over all the pages
-    for si_val in get_pages(tmp_response):
-        dataset_parameters['si'] = si_val
-        response = requests.get(search_url, dataset_parameters).json()
-        for selected_data_set in response['features']:
-            product_id = selected_data_set['properties']['identifier']
-            dataset_list.append(product_id)
-        progress_bar.update(n_items)
+    progress_bar = tqdm(total=n_items, miniters=100, mininterval=0.5)
+
+    dataset_list: List[str] = []
+    for page in _iter_pages(query_url, tmp_response, n_workers):
+        dataset_list.extend(page)
+        progress_bar.update(len(page))
     progress_bar.close()
 
     if verbose:
@@ -138,7 +301,18 @@ def find_files_on_store(start_date: datetime,
     return dataset_list
 
 
-def get_token(access_key: str) -> dict:
+def _get_access_key(eum_access_key: Optional[str] = None) -> str:
+    """Build the authorization for token requests, falling back to the `EUM_ACCESS_KEY` environment variable."""
+    if eum_access_key is None:
+        try:
+            eum_access_key = os.environ['EUM_ACCESS_KEY']
+        except KeyError:
+            raise KeyError("No EUMETSAT access key supplied. "
+                           "Pass directly via `eum_access_key` or set the `EUM_ACCESS_KEY` environment variable.")
+    return 'Basic ' + eum_access_key
+
+
+def get_token(access_key: str) -> Dict[str, Any]:
     """Get the data download token from the user access_key supplied by EUM.
 
     Parameters:
@@ -147,21 +321,98 @@ def get_token(access_key: str) -> dict:
 
     Returns:
         dict:
-            A dict containing the download token returned by the EUMETSAT API.
+            The token details returned by the EUMETSAT API, including the download token itself
+            (`access_token`) and its lifetime in seconds (`expires_in`).
 
     """
-    base_url_wso2 = "http://api.eumetsat.int/"
+    base_url_wso2 = "https://api.eumetsat.int/"
     headers = {'Authorization': access_key}
     payload = {'grant_type': 'client_credentials'}
     url_ = urljoin(base_url_wso2, 'token')
-    response = requests.post(url_, headers=headers, data=payload)
-    tok = response.json()['access_token']
-    token = {'access_token': tok}
-    return token
+    response = _with_retry(_checked_request, 'POST', url_, headers=headers, data=payload)
+    return _decode_json(response)
+
+
+@dataclass
+class _TokenState:
+    """The current download token, shared between the download workers and the refresh timer."""
+    access_key: str
+    verbose: bool = False
+    token: str = ''
+    expiry: float = 0.
+    active: bool = True
+    timer: Optional[threading.Timer] = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def _schedule_refresh(state: _TokenState, delay: float):
+    """Schedule the next token refresh in `delay` seconds, must be called while holding `state.lock`."""
+    state.timer = threading.Timer(max(delay, 1), _scheduled_refresh, (state,))
+    state.timer.daemon = True
+    state.timer.start()
+
+
+def _refresh_token(state: _TokenState):
+    """Fetch a new download token and schedule the next refresh shortly before it expires."""
+    token = get_token(state.access_key)
+    expires_in = float(token.get('expires_in', _DEFAULT_TOKEN_LIFETIME))
+    with state.lock:
+        if not state.active:
+            return
+        state.token = token['access_token']
+        state.expiry = time.monotonic() + expires_in
+        _schedule_refresh(state, state.expiry - time.monotonic() - 60)
+    if state.verbose:
+        print("Retrieved access token from EUMETSAT.")
+
+
+def _scheduled_refresh(state: _TokenState):
+    """Refresh the token from the timer thread, trying again shortly if the request fails."""
+    try:
+        _refresh_token(state)
+    except (requests.exceptions.RequestException, KeyError, ValueError) as err:
+        print(f'ERROR: Failed to refresh access token, retrying: {err}')
+        with state.lock:
+            if state.active:
+                _schedule_refresh(state, 30)
+
+
+def _auth_headers(state: _TokenState) -> Dict[str, str]:
+    """Build the headers authorizing a download request with the current token."""
+    return {'Authorization': 'Bearer ' + state.token}
 
 
-def get_url_filename(dataset_list: list, local_dir: str, top_url: str) -> (str, str):
-    """Generate remote url and local filename for download from a list of dataset filenames.
+def _stop_token_refresh(state: _TokenState):
+    """Cancel any pending token refresh."""
+    with state.lock:
+        state.active = False
+        if state.timer is not None:
+            state.timer.cancel()
+
+
+@contextmanager
+def _refreshed_token(access_key: str, verbose: bool = False) -> Iterator[_TokenState]:
+    """Keep a download token refreshed in the background for the duration of the `with` block.
+
+    The refresh timer is stopped on leaving the block, however it is left, so that it does not
+    keep fetching tokens for the rest of the process.
+    """
+    state = _TokenState(access_key, verbose=verbose)
+    _refresh_token(state)
+    try:
+        yield state
+    finally:
+        _stop_token_refresh(state)
+
+
+def _url_filename(product_id: str, local_dir: str, top_url: str) -> Tuple[str, str]:
+    """Build the remote url and local filename for a single dataset."""
+    return (f"{top_url}products/{urllib.parse.quote(product_id, safe='')}",
+            os.path.join(local_dir, product_id + '.zip'))
+
+
+def get_url_filename(dataset_list: List[str], local_dir: str, top_url: str) -> List[Tuple[str, str]]:
+    """Build the remote url and local filename for download from a list of dataset filenames.
 
     Parameters:
         dataset_list, list:
@@ -172,25 +423,158 @@ def get_url_filename(dataset_list: list, local_dir: str, top_url: str) -> (str,
             The download service URL for the EUMETSAT API.
 
     Returns:
-        str:
-            url of the file to download
-        str:
-            filename of the corresponding local file.
+        list:
+            (url, filename) pairs giving the url of each file to download
+            and the filename of the corresponding local file.
     """
 
-    for product_id in dataset_list:
-        local_filename = local_dir + product_id + '.zip'
-        download_url = top_url + 'products/{}'.format(urllib.parse.quote(product_id))
-        yield download_url, local_filename
+    return [_url_filename(product_id, local_dir, top_url) for product_id in dataset_list]
+
+
+def _scan_existing(output_dir: str) -> Dict[str, int]:
+    """Find the size of every file already in the output directory with a single directory scan."""
+    if not os.path.isdir(output_dir):
+        return {}
+    with os.scandir(output_dir) as entries:
+        return {entry.name: entry.stat().st_size for entry in entries if entry.is_file()}
+
+
+def _remote_head(download_url: str, token_state: _TokenState) -> Optional[requests.Response]:
+    """Send a HEAD request for a remote file, returning None if it fails."""
+    try:
+        return _with_retry(_checked_request, 'HEAD', download_url,
+                           headers=_auth_headers(token_state), allow_redirects=True)
+    except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError):
+        return None
+
+
+def _remote_size(download_url: str, token_state: _TokenState) -> Optional[int]:
+    """Return the size in bytes of a remote file from its `Content-Length`, or None if unavailable."""
+    response = _remote_head(download_url, token_state)
+    if response is None:
+        return None
+    try:
+        return int(response.headers['Content-Length'])
+    except (KeyError, ValueError):
+        return None
+
+
+def _download_workers(download_url: str, token_state: _TokenState, n_workers: int) -> int:
+    """Limit the number of concurrent downloads to any rate limit advertised by the download service."""
+    response = _remote_head(download_url, token_state)
+    if response is None:
+        return n_workers
+    return _max_in_flight(response, n_workers)
+
 
+class _DownloadCancelled(Exception):
+    """Raised when a download is abandoned part way because the whole run is being stopped."""
 
-def download_files(dataset_list: list,
+
+def _fetch_file(download_url: str, out_filename: str, block_size: int, file_check_limit: int,
+                token_state: _TokenState, resume: bool = False,
+                stop_event: Optional[threading.Event] = None) -> int:
+    """Stream a single remote file to disk, optionally appending to a partial copy of the file.
+
+    Returns the size of the file in bytes. Responses that report a size below `file_check_limit`
+    are not written to disk at all. If `stop_event` is set while the file is being written then
+    _DownloadCancelled is raised, leaving the partial file on disk.
+    """
+    offset = os.path.getsize(out_filename) if resume and os.path.exists(out_filename) else 0
+    headers = _auth_headers(token_state)
+    if offset:
+        headers['Range'] = f'bytes={offset}-'
+    with _checked_request('GET', download_url, headers=headers, stream=True) as response:
+        if response.status_code != 206:
+            # The server has sent the whole file
+            offset = 0
+        try:
+            filesize = offset + int(response.headers['Content-Length'])
+        except (KeyError, ValueError):
+            filesize = None
+        if filesize is not None and filesize < file_check_limit:
+            return filesize
+
+        with open(out_filename, 'ab' if offset else 'wb', buffering=block_size * 4) as fd:
+            for chunk in response.iter_content(chunk_size=block_size):
+                if stop_event is not None and stop_event.is_set():
+                    raise _DownloadCancelled(out_filename)
+                fd.write(chunk)
+    return filesize if filesize is not None else os.path.getsize(out_filename)
+
+
+def _download_one(download_url: str,
+                  out_filename: str,
+                  block_size: int,
+                  file_check_limit: int,
+                  token_state: _TokenState,
+                  existing_size: Optional[int] = None,
+                  stop_event: Optional[threading.Event] = None):
+    """Download a single dataset from the store, discarding it if it looks invalid.
+
+    Parameters:
+        download_url, str:
+            The remote URL of the file to download.
+        out_filename, str:
+            The local filename to save the file to.
+        block_size, int:
+            Size in bytes of each downloaded chunk.
+        file_check_limit, int:
+            Minimum expected filesize in bytes, smaller files are removed.
+        token_state, _TokenState:
+            Holds the current download token.
+        existing_size, int:
+            Size in bytes of the local file if it already exists, None otherwise.
+            Local files smaller than the remote file are resumed rather than skipped.
+        stop_event, threading.Event:
+            Optional event that is set when the run is stopped. The download is then abandoned,
+            keeping any partial file so that it can be resumed later.
+
+    """
+    if stop_event is not None and stop_event.is_set():
+        return
+    resume = False
+    if existing_size is not None:
+        remote_size = _remote_size(download_url, token_state)
+        if remote_size is None or existing_size >= remote_size:
+            print(f"File exists: {out_filename}")
+            return
+        print(f"Resuming partial file: {out_filename}")
+        resume = True
+
+    try:
+        filesize = _with_retry(_fetch_file, download_url, out_filename, block_size, file_check_limit,
+                               token_state, resume, stop_event)
+    except _DownloadCancelled:
+        print(f'Cancelled download, partial file kept: {out_filename}')
+        return
+    except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as err:
+        print(f'ERROR: Failed to download {out_filename}: {err}')
+        # A partial file being resumed is kept, so that a later run can carry on from it
+        if not resume and os.path.exists(out_filename):
+            os.remove(out_filename)
+        return
+    if filesize < file_check_limit:
+        print(f'ERROR: Bad file {out_filename}\n. Possible credential problem. Size: {filesize}')
+        if os.path.exists(out_filename):
+            os.remove(out_filename)
+
+
+def _raise_failures(failures: List[Tuple[str, Exception]], n_files: int):
+    """Raise a single error summarising the downloads that failed unexpectedly, if there were any."""
+    if failures:
+        failed = ', '.join(out_filename for out_filename, _ in failures)
+        raise RuntimeError(f'{len(failures)} of {n_files} downloads failed: {failed}') from failures[0][1]
+
+
+def download_files(dataset_list: List[str],
                    remote_url: str,
                    output_dir: str,
-                   eum_access_key: str = None,
+                   eum_access_key: Optional[str] = None,
                    verbose: bool = False,
-                   block_size: int = 1024,
-                   file_check_limit: int = 100000):
+                   block_size: int = 262144,
+                   file_check_limit: int = 100000,
+                   n_workers: int = 8):
     """Download datasets from the store to local computer.
 
     Parameters:
@@ -205,55 +589,206 @@ def download_files(dataset_list: list,
         verbose, bool:
             Determines whether some additional progress information is printed to screen.
         block_size, int:
-            Size in bytes of each downloaded chunk. Default is 1024 bytes.
+            Size in bytes of each downloaded chunk. Default is 262,144 bytes (256 KiB).
         file_check_limit, int:
             Rough estimate of expected filesize for downloads in bytes,
             used to check if file downloaded successfully or if there may be an issue.
             Default is 100,000 bytes.
+        n_workers, int:
+            Number of files to download concurrently. Default is 8.
 
     """
 
+    # Each product is only downloaded once, even if it appears more than once in the list
+    dataset_list = list(dict.fromkeys(dataset_list))
     n_files = len(dataset_list)
     counter = 1
 
-    if eum_access_key is None:
+    access_key = _get_access_key(eum_access_key)
+    failures: List[Tuple[str, Exception]] = []
+    url_filenames = get_url_filename(dataset_list, output_dir, remote_url)
+
+    # The token is refreshed in the background shortly before it expires
+    with _refreshed_token(access_key, verbose) as token_state:
+        # Check which files are already present up front rather than once per file
+        existing = _scan_existing(output_dir)
+        if url_filenames:
+            n_workers = _download_workers(url_filenames[0][0], token_state, n_workers)
+
+        stop_event = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=n_workers)
         try:
-            eum_access_key = os.environ['EUM_ACCESS_KEY']
-        except KeyError:
-            raise KeyError("No EUMETSAT access key supplied. "
-                           "Pass directly via `eum_access_key` or set the `EUM_ACCESS_KEY` environment variable.")
+            futures = {executor.submit(_download_one, download_url, out_filename, block_size, file_check_limit,
+                                       token_state, existing.get(os.path.basename(out_filename)),
+                                       stop_event): out_filename
+                       for download_url, out_filename in url_filenames}
+            for future in tqdm(as_completed(futures), total=n_files, mininterval=0.5):
+                try:
+                    future.result()
+                except Exception as err:
+                    print(f'ERROR: Failed to download {futures[future]}: {err}')
+                    failures.append((futures[future], err))
+                if verbose:
+                    print(f'Downloaded file {counter} of {n_files}')
+                counter += 1
+        except BaseException:
+            # On Ctrl-C drop the queued downloads and cut short the running ones, rather than
+            # waiting for every remaining file to be fetched
+            stop_event.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+
+    _raise_failures(failures, n_files)
+
+
+def search_and_download(start_date: datetime,
+                        end_date: datetime,
+                        search_url: str,
+                        remote_url: str,
+                        output_dir: str,
+                        collection_id: str = "EO:EUM:DAT:MSG:HRSEVIRI",
+                        bbox: Optional[Sequence[Sequence[float]]] = None,
+                        eum_access_key: Optional[str] = None,
+                        verbose: bool = False,
+                        block_size: int = 262144,
+                        file_check_limit: int = 100000,
+                        n_search_workers: int = 16,
+                        n_workers: int = 8) -> List[str]:
+    """Search the data store and download the matching files, starting downloads while the search continues.
+
+    This is equivalent to find_files_on_store() followed by download_files(), except that products are put
+    on a queue as each page of search results arrives and a pool of download workers takes them from it.
 
-    access_key = 'Basic ' + eum_access_key
-    access_token = get_token(access_key)
-    if verbose:
-        print("Retrieved access token from EUMETSAT.")
-    initial_time = datetime.utcnow()
+    Parameters:
+        start_date, datetime:
+           Specifies earliest sensing time to search for.
+        end_date, datetime:
+           Specifies final sensing time to search for.
+        search_url, str:
+            The URL of the data store search endpoint.
+        remote_url, str:
+            The URL of the data store download endpoint.
+        output_dir, str:
+            Directory name where downloaded files will be put.
+        collection_id, string:
+           The name of the EUMETSAT collection to search for. Defaults to SEVIRI prime.
+        bbox, list:
+           Boundaries of the region to search for, in format [[min_lon, min_lat], [max_lon, max_lat]]
+           Default is full globe search.
+        eum_access_key, str:
+            The API access key defined on the EUMETSAT user portal.
+        verbose, bool:
+            Determines whether some additional progress information is printed to screen.
+        block_size, int:
+            Size in bytes of each downloaded chunk. Default is 262,144 bytes (256 KiB).
+        file_check_limit, int:
+            Rough estimate of expected filesize for downloads in bytes,
+            used to check if file downloaded successfully or if there may be an issue.
+            Default is 100,000 bytes.
+        n_search_workers, int:
+            Number of result pages to request concurrently. Default is 16.
+        n_workers, int:
+            Number of files to download concurrently. Default is 8.
 
-    for download_url, out_filename in tqdm(get_url_filename(dataset_list, output_dir, remote_url)):
-        if verbose:
-            print(f'Downloading file {counter} of {n_files}')
-        counter += 1
-        if os.path.exists(out_filename):
-            print(f"File exists: {out_filename}")
-            continue
-        cur_time = datetime.utcnow()
-        if cur_time > initial_time + timedelta(minutes=20):
-            if verbose:
-                print("Retrieving new token")
-            access_token = get_token(access_key)
-            initial_time = cur_time
-
-        response = requests.get(download_url, params=access_token, stream=True)
-        with open(out_filename, 'wb') as fd:
-            for chunk in response.iter_content(chunk_size=block_size):
-                fd.write(chunk)
-        filesize = os.path.getsize(out_filename)
-        if filesize < file_check_limit:
-            print(f'ERROR: Bad file {out_filename}\n. Possible credential problem. Size: {filesize}')
-            os.remove(out_filename)
+    Returns:
+        list:
+            A list of filenames found on the server that correspond to the EUMETSAT search.
+
+    """
+
+    # Check the access key before doing any searching
+    access_key = _get_access_key(eum_access_key)
+
+    query_url = _build_query_url(start_date, end_date, search_url, collection_id, bbox)
+    tmp_response, n_search_workers = _probe_search(query_url, n_search_workers)
+    n_items = tmp_response['properties']['totalResults']
+    if verbose:
+        print(f'A total of {n_items} files have been found.')
+
+    dataset_list: List[str] = []
+    failures: List[Tuple[str, Exception]] = []
+    product_queue: queue.Queue[Optional[str]] = queue.Queue(maxsize=256)
+    stop_event = threading.Event()
+
+    def put(item: Optional[str]) -> bool:
+        # Wait for space on the queue, giving up if the run is stopped
+        while not stop_event.is_set():
+            try:
+                product_queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def producer() -> None:
+        seen: Set[str] = set()
+        try:
+            for page in _iter_pages(query_url, tmp_response, n_search_workers):
+                for product_id in page:
+                    # Results can repeat across pages if the collection changes during the search
+                    if product_id in seen:
+                        continue
+                    seen.add(product_id)
+                    dataset_list.append(product_id)
+                    if not put(product_id):
+                        return
+            progress_bar.total = len(dataset_list)
+            progress_bar.refresh()
+        finally:
+            # One sentinel per download worker to tell it the search has finished
+            for _ in range(n_workers):
+                if not put(None):
+                    break
+
+    def consumer() -> None:
+        while not stop_event.is_set():
+            try:
+                product_id = product_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if product_id is None:
+                return
+            download_url, out_filename = _url_filename(product_id, output_dir, remote_url)
+            # Keep taking products from the queue after an error so that the search can always finish
+            try:
+                _download_one(download_url, out_filename, block_size, file_check_limit,
+                              token_state, existing.get(os.path.basename(out_filename)), stop_event)
+            except Exception as err:
+                print(f'ERROR: Failed to download {out_filename}: {err}')
+                failures.append((out_filename, err))
+            progress_bar.update(1)
+
+    with _refreshed_token(access_key, verbose) as token_state:
+        existing = _scan_existing(output_dir)
+        first_page = _parse_identifiers(tmp_response)
+        if first_page:
+            first_url, _ = _url_filename(first_page[0], output_dir, remote_url)
+            n_workers = _download_workers(first_url, token_state, n_workers)
+
+        progress_bar = tqdm(total=n_items, mininterval=0.5)
+        executor = ThreadPoolExecutor(max_workers=n_workers + 1)
+        try:
+            search_future = executor.submit(producer)
+            download_futures = [executor.submit(consumer) for _ in range(n_workers)]
+            search_future.result()
+            for future in download_futures:
+                future.result()
+        except BaseException:
+            # On Ctrl-C, or if the search fails, tell the search and download workers to stop
+            # rather than leaving them blocked on the queue
+            stop_event.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            progress_bar.close()
+        executor.shutdown()
+
+    _raise_failures(failures, len(dataset_list))
+    return dataset_list
 
 
-def retrieve_collection_dict(api_endpoint: str = "http://api.eumetsat.int/") -> dict:
+def retrieve_collection_dict(api_endpoint: str = "https://api.eumetsat.int/") -> Dict[str, str]:
     """Download list of data collections via that API.
 
     Parameter:
@@ -266,9 +801,9 @@ def retrieve_collection_dict(api_endpoint: str = "http://api.eumetsat.int/") ->
     # Retrieve all collections: size refers to the max number of returned results
     service_navigator = api_endpoint + "product-navigator/csw/record/_search"
     collection_parameters = {'_source_include': 'id,abstract', 'size': '500'}
-    response = requests.get(service_navigator, params=collection_parameters)
+    response = _with_retry(_checked_request, 'GET', service_navigator, params=collection_parameters)
 
     # build the json format responses into a list
-    collection_list = {c['_source']['id']: c['_source']['abstract'] for c in response.json()['hits']['hits']}
+    collection_list = {c['_source']['id']: c['_source']['abstract'] for c in _decode_json(response)['hits']['hits']}
 
     return collection_list
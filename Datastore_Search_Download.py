@@ -33,8 +33,8 @@ import click
 @click.option('--out_dir', default='./')
 @click.option('--collection', default='EO:EUM:DAT:METOP:IASIL1C-ALL')
 @click.option('--eum_access_key', default=None)
-def main(start_dt: datetime,
-         end_dt: datetime,
+def main(start_dt: str,
+         end_dt: str,
          min_lon: int,
          max_lon: int,
          min_lat: int,
@@ -65,18 +65,18 @@ def main(start_dt: datetime,
 
     """
     try:
-        start_dt = datetime.strptime(start_dt, '%Y%m%d%H%M').replace(tzinfo=timezone.utc)
+        start_time = datetime.strptime(start_dt, '%Y%m%d%H%M').replace(tzinfo=timezone.utc)
     except ValueError:
         try:
-            start_dt = datetime.strptime(start_dt, '%Y%m%d').replace(tzinfo=timezone.utc)
+            start_time = datetime.strptime(start_dt, '%Y%m%d').replace(tzinfo=timezone.utc)
         except ValueError:
             raise ValueError("Start date/time must be in YYYYMMDD or YYYYMMDDHHMM format.")
 
     try:
-        end_dt = datetime.strptime(end_dt, '%Y%m%d%H%M').replace(tzinfo=timezone.utc)
+        end_time = datetime.strptime(end_dt, '%Y%m%d%H%M').replace(tzinfo=timezone.utc)
     except ValueError:
         try:
-            end_dt = datetime.strptime(end_dt, '%Y%m%d').replace(tzinfo=timezone.utc)
+            end_time = datetime.strptime(end_dt, '%Y%m%d').replace(tzinfo=timezone.utc)
         except ValueError:
             raise ValueError("End date/time must be in YYYYMMDD or YYYYMMDDHHMM format.")
 
@@ -89,19 +89,16 @@ def main(start_dt: datetime,
     else:
         search_bbox = None
 
-    # Search for datasets:
-    datasets = DSU.find_files_on_store(start_dt,
-                                       end_dt,
-                                       service_search,
-                                       collection,
-                                       bbox=search_bbox)
-    print(f"A total of {len(datasets)} datasets have been found.")
-
-    DSU.download_files(datasets,
-                       service_download,
-                       output_dir=out_dir,
-                       eum_access_key=eum_access_key,
-                       verbose=True)
+    # Search for datasets, downloading them as they are found:
+    DSU.search_and_download(start_time,
+                            end_time,
+                            service_search,
+                            service_download,
+                            output_dir=out_dir,
+                            collection_id=collection,
+                            bbox=search_bbox,
+                            eum_access_key=eum_access_key,
+                            verbose=True)
 
 
 if __name__ == '__main__':